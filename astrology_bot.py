@@ -12,15 +12,19 @@ A natal chart calculation and interpretation bot that:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 import re
-from typing import AsyncIterable
+from collections import OrderedDict
+from operator import itemgetter
+from typing import AsyncIterable, Iterator
 
 import fastapi_poe as fp
-from modal import App, Image, asgi_app
+import orjson
+from modal import App, Image, asgi_app, enter
 
-from chart_engine import calculate_chart, calculate_transits
+from chart_engine import calculate_chart_async, calculate_transits, warm_up
 
 HOUSE_SYSTEM_INFO = {
     "whole_sign": "Whole Sign Houses: The zodiac sign of the Ascendant becomes the 1st house, and each subsequent sign rules the next house. All planets in a given sign belong to that house - this is normal and expected, not a coincidence.",
@@ -43,6 +47,65 @@ SIDEREAL_MODE_NAMES = {
 }
 
 
+# Plain-text birth data patterns, compiled once at import
+_DATE_PATTERNS = [
+    re.compile(p)
+    for p in (
+        r"(\d{4}-\d{2}-\d{2})",
+        r"(\d{1,2}/\d{1,2}/\d{4})",
+        r"(\d{1,2}-\d{1,2}-\d{4})",
+        r"((?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4})",
+    )
+]
+
+_TIME_PATTERNS = [
+    re.compile(p)
+    for p in (
+        r"(\d{1,2}:\d{2}\s*(?:AM|PM|am|pm))",
+        r"(\d{1,2}:\d{2})",
+        r"(\d{1,2}\s*(?:AM|PM|am|pm))",
+    )
+]
+
+_CITY_RE = re.compile(r"([A-Za-z][A-Za-z\s]+,\s*[A-Za-z]{2,}(?:\s+[A-Za-z]+)?)")
+_WS_RE = re.compile(r"\s+")
+
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}$")
+_SLASH_DATE_RE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})$")
+_DASH_DATE_RE = re.compile(r"(\d{1,2})-(\d{1,2})-(\d{4})$")
+
+_MONTHS = {
+    "january": "01",
+    "february": "02",
+    "march": "03",
+    "april": "04",
+    "may": "05",
+    "june": "06",
+    "july": "07",
+    "august": "08",
+    "september": "09",
+    "october": "10",
+    "november": "11",
+    "december": "12",
+}
+
+_MONTHS_RE = re.compile(
+    r"(" + "|".join(_MONTHS) + r")\s+(\d{1,2}),?\s+(\d{4})", re.IGNORECASE
+)
+
+# "<date> <time> <city>" in one pass; the common input shape
+_BIRTH_DATA_RE = re.compile(
+    r"(?P<date>\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}/\d{4}|\d{1,2}-\d{1,2}-\d{4}"
+    r"|(?:" + "|".join(_MONTHS) + r")\s+\d{1,2},?\s+\d{4})"
+    r"[\s,]+(?P<time>\d{1,2}:\d{2}(?:\s*[AP]M)?|\d{1,2}\s*[AP]M)\b(?!:)"
+    r"[\s,]+(?P<city>.+)",
+    re.IGNORECASE,
+)
+
+_CLOCK_TIME_RE = re.compile(r"(\d{1,2}):(\d{2})\s*(AM|PM)?$", re.IGNORECASE)
+_HOUR_TIME_RE = re.compile(r"(\d{1,2})\s*(AM|PM)$", re.IGNORECASE)
+
+
 def parse_plain_text_birth_data(text: str) -> dict | None:
     """
     Parse plain text birth data input.
@@ -56,22 +119,43 @@ def parse_plain_text_birth_data(text: str) -> dict | None:
     """
     text = text.strip()
 
-    date_patterns = [
-        r"(\d{4}-\d{2}-\d{2})",
-        r"(\d{1,2}/\d{1,2}/\d{4})",
-        r"(\d{1,2}-\d{1,2}-\d{4})",
-        r"(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}",
-    ]
+    match = _BIRTH_DATA_RE.fullmatch(text)
+    if match:
+        date_match = match.group("date")
+        time_match = match.group("time")
+        city = _clean_city(match.group("city"))
+    else:
+        parts = _scan_birth_data(text)
+        if not parts:
+            return None
+        date_match, time_match, city = parts
 
-    time_patterns = [
-        r"(\d{1,2}:\d{2})",
-        r"(\d{1,2}:\d{2}\s*(?:AM|PM|am|pm))",
-        r"(\d{1,2}\s*(?:AM|PM|am|pm))",
-    ]
+    if len(city) < 2:
+        return None
 
+    parsed_date = normalize_date(date_match)
+    parsed_time = normalize_time(time_match)
+
+    if not parsed_date or not parsed_time:
+        return None
+
+    return {
+        "date": parsed_date,
+        "time": parsed_time,
+        "city": city,
+    }
+
+
+def _scan_birth_data(text: str) -> tuple[str, str, str] | None:
+    """
+    Fallback for parse_plain_text_birth_data when the input isn't in
+    date-time-city order: search for each part separately.
+
+    Returns (date, time, city) strings or None if date or time is missing.
+    """
     date_match = None
-    for pattern in date_patterns:
-        match = re.search(pattern, text)
+    for pattern in _DATE_PATTERNS:
+        match = pattern.search(text)
         if match:
             date_match = match.group(1)
             break
@@ -80,8 +164,8 @@ def parse_plain_text_birth_data(text: str) -> dict | None:
         return None
 
     time_match = None
-    for pattern in time_patterns:
-        match = re.search(pattern, text)
+    for pattern in _TIME_PATTERNS:
+        match = pattern.search(text)
         if match:
             time_match = match.group(1)
             break
@@ -89,72 +173,41 @@ def parse_plain_text_birth_data(text: str) -> dict | None:
     if not time_match:
         return None
 
-    remaining = text
-    remaining = re.sub(re.escape(date_match), "", remaining, count=1)
-    remaining = re.sub(re.escape(time_match), "", remaining, count=1)
+    remaining = text.replace(date_match, "", 1).replace(time_match, "", 1)
 
-    city_match = re.search(
-        r"([A-Za-z][A-Za-z\s]+,\s*[A-Za-z]{2,}(?:\s+[A-Za-z]+)?)", remaining
-    )
+    return date_match, time_match, _clean_city(remaining)
+
+
+def _clean_city(remaining: str) -> str:
+    """Pull a "City, Region" name out of the text left after date and time."""
+    city_match = _CITY_RE.search(remaining)
     if city_match:
         city = city_match.group(1).strip()
     else:
         city = remaining.strip(" ,;-:")
 
-    city = re.sub(r"\s+", " ", city).strip()
-
-    if len(city) < 2:
-        return None
-
-    parsed_date = normalize_date(date_match)
-    parsed_time = normalize_time(time_match)
-
-    if not parsed_date or not parsed_time:
-        return None
-
-    return {
-        "date": parsed_date,
-        "time": parsed_time,
-        "city": city,
-    }
+    return _WS_RE.sub(" ", city).strip()
 
 
 def normalize_date(date_str: str) -> str | None:
     """Convert various date formats to YYYY-MM-DD."""
-    months = {
-        "january": "01",
-        "february": "02",
-        "march": "03",
-        "april": "04",
-        "may": "05",
-        "june": "06",
-        "july": "07",
-        "august": "08",
-        "september": "09",
-        "october": "10",
-        "november": "11",
-        "december": "12",
-    }
-
-    if re.match(r"\d{4}-\d{2}-\d{2}$", date_str):
+    if _ISO_DATE_RE.match(date_str):
         return date_str
 
-    match = re.match(r"(\d{1,2})/(\d{1,2})/(\d{4})$", date_str)
+    match = _SLASH_DATE_RE.match(date_str)
     if match:
         return f"{match.group(3)}-{match.group(1).zfill(2)}-{match.group(2).zfill(2)}"
 
-    match = re.match(r"(\d{1,2})-(\d{1,2})-(\d{4})$", date_str)
+    match = _DASH_DATE_RE.match(date_str)
     if match:
         return f"{match.group(3)}-{match.group(1).zfill(2)}-{match.group(2).zfill(2)}"
 
-    for month_name, month_num in months.items():
-        match = re.search(
-            rf"({month_name})\s+(\d{{1,2}}),?\s+(\d{{4}})", date_str, re.IGNORECASE
-        )
-        if match:
-            day = match.group(2).zfill(2)
-            year = match.group(3)
-            return f"{year}-{month_num}-{day}"
+    match = _MONTHS_RE.search(date_str)
+    if match:
+        month_num = _MONTHS[match.group(1).lower()]
+        day = match.group(2).zfill(2)
+        year = match.group(3)
+        return f"{year}-{month_num}-{day}"
 
     return None
 
@@ -163,34 +216,33 @@ def normalize_time(time_str: str) -> str | None:
     """Convert various time formats to HH:MM (24-hour)."""
     time_str = time_str.strip()
 
-    match = re.match(r"(\d{1,2}):(\d{2})\s*(AM|PM)?$", time_str, re.IGNORECASE)
+    match = _CLOCK_TIME_RE.match(time_str)
     if match:
-        hour = int(match.group(1))
-        minute = match.group(2)
-        am_pm = match.group(3)
+        return _to_24_hour(int(match.group(1)), int(match.group(2)), match.group(3))
 
-        if am_pm:
-            am_pm = am_pm.upper()
-            if am_pm == "PM" and hour != 12:
-                hour += 12
-            elif am_pm == "AM" and hour == 12:
-                hour = 0
+    match = _HOUR_TIME_RE.match(time_str)
+    if match:
+        return _to_24_hour(int(match.group(1)), 0, match.group(2))
 
-        return f"{hour:02d}:{minute}"
+    return None
 
-    match = re.match(r"(\d{1,2})\s*(AM|PM)$", time_str, re.IGNORECASE)
-    if match:
-        hour = int(match.group(1))
-        am_pm = match.group(2).upper()
 
+def _to_24_hour(hour: int, minute: int, am_pm: str | None) -> str | None:
+    """Format a clock time as HH:MM, or None if it isn't a valid time."""
+    if am_pm:
+        # 12-hour clock: "22:30 PM" or "13 PM" is not a real time
+        if not 1 <= hour <= 12:
+            return None
+        am_pm = am_pm.upper()
         if am_pm == "PM" and hour != 12:
             hour += 12
         elif am_pm == "AM" and hour == 12:
             hour = 0
 
-        return f"{hour:02d}:00"
+    if hour > 23 or minute > 59:
+        return None
 
-    return None
+    return f"{hour:02d}:{minute:02d}"
 
 
 # Configuration
@@ -198,6 +250,144 @@ bot_access_key = os.getenv("POE_ACCESS_KEY")
 bot_name = os.getenv("POE_BOT_NAME", "")
 poe_model = os.getenv("POE_MODEL", "Kimi-K2.5")
 
+# Max serialized chart contexts kept for follow-up questions
+_CHART_CACHE_SIZE = 1024
+
+
+def _dumps_compact(obj: object, sort_keys: bool = False) -> str:
+    """
+    Serialize client-supplied JSON compactly with orjson.
+
+    Falls back to the stdlib for values orjson rejects but json.loads accepts,
+    such as integers beyond 64 bits.
+    """
+    option = orjson.OPT_SORT_KEYS if sort_keys else 0
+    try:
+        return orjson.dumps(obj, option=option).decode()
+    except orjson.JSONEncodeError:
+        return json.dumps(obj, separators=(",", ":"), sort_keys=sort_keys)
+
+
+# C-level field getters for prompt formatting
+_BY_ORB = itemgetter("orb")
+_SIGN_DEGREE = itemgetter("sign", "degree")
+_ASPECT_FIELDS = itemgetter("planet1", "aspect", "planet2", "orb")
+_TRANSIT_FIELDS = itemgetter("transit_planet", "aspect", "natal_planet", "orb")
+
+
+def _placement_fields(positions: dict) -> Iterator[tuple[str, tuple[str, float]]]:
+    """Yield (name, (sign, degree)) for each position in a planets/houses dict."""
+    return zip(positions, map(_SIGN_DEGREE, positions.values()))
+
+
+def _is_plain_text(msg: fp.PartialResponse) -> bool:
+    """True for ordinary streamed text that can be merged with its neighbours."""
+    # attachment/tool_calls only exist in newer fastapi-poe releases
+    return type(msg) is fp.PartialResponse and not (
+        msg.is_suggested_reply
+        or msg.is_replace_response
+        or msg.data
+        or getattr(msg, "attachment", None)
+        or getattr(msg, "tool_calls", None)
+    )
+
+
+def _merged_text(buffer: list[str], index: int | None) -> fp.PartialResponse:
+    """Build one PartialResponse from buffered text chunks."""
+    if index is None:
+        return fp.PartialResponse(text="".join(buffer))
+    return fp.PartialResponse(text="".join(buffer), index=index)
+
+
+async def _coalesce(
+    source: AsyncIterable[fp.PartialResponse],
+    max_tokens: int = 24,
+    max_delay: float = 0.05,
+) -> AsyncIterable[fp.PartialResponse]:
+    """
+    Merge consecutive streamed text chunks to cut per-chunk framing overhead.
+
+    The first text chunk is passed through immediately so time-to-first-token
+    is unchanged. After that, text is buffered and flushed as one
+    PartialResponse once max_tokens chunks are buffered or max_delay seconds
+    have passed since the first buffered chunk, whichever comes first.
+    Non-text messages (e.g. the leading meta event, suggested replies or
+    replace-response) flush the buffer and pass through, as does a change of
+    message index.
+
+    Args:
+        source: Stream of PartialResponse chunks (e.g. from fp.stream_request)
+        max_tokens: Max chunks merged into one response
+        max_delay: Max seconds a chunk waits in the buffer
+
+    Yields:
+        PartialResponse chunks
+    """
+    loop = asyncio.get_running_loop()
+    iterator = source.__aiter__()
+    buffer: list[str] = []
+    buffer_index = None
+    deadline = 0.0
+    first = True
+    # Awaited via asyncio.wait rather than wait_for so a flush timeout never
+    # cancels the upstream read
+    pending = None
+
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(iterator.__anext__())
+
+            timeout = max(deadline - loop.time(), 0) if buffer else None
+            done, _ = await asyncio.wait({pending}, timeout=timeout)
+            if not done:
+                yield _merged_text(buffer, buffer_index)
+                buffer.clear()
+                continue
+
+            try:
+                msg = pending.result()
+            except StopAsyncIteration:
+                break
+            except Exception:
+                # Don't drop buffered text when the upstream stream fails
+                if buffer:
+                    yield _merged_text(buffer, buffer_index)
+                raise
+            finally:
+                pending = None
+
+            if not _is_plain_text(msg):
+                if buffer:
+                    yield _merged_text(buffer, buffer_index)
+                    buffer.clear()
+                yield msg
+                continue
+
+            if first:
+                first = False
+                yield msg
+                continue
+
+            index = getattr(msg, "index", None)
+            if buffer and index != buffer_index:
+                yield _merged_text(buffer, buffer_index)
+                buffer.clear()
+
+            if not buffer:
+                deadline = loop.time() + max_delay
+                buffer_index = index
+            buffer.append(msg.text)
+            if len(buffer) >= max_tokens:
+                yield _merged_text(buffer, buffer_index)
+                buffer.clear()
+
+        if buffer:
+            yield _merged_text(buffer, buffer_index)
+    finally:
+        if pending is not None:
+            pending.cancel()
+
 
 class AstrologyBot(fp.PoeBot):
     """
@@ -206,6 +396,11 @@ class AstrologyBot(fp.PoeBot):
     Handles both chart calculation and LLM interpretation.
     """
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # (conversation_id, chart identity) -> compact chart JSON for follow-ups
+        self._chart_cache: OrderedDict[tuple[str, str], str] = OrderedDict()
+
     async def get_response(
         self, request: fp.QueryRequest
     ) -> AsyncIterable[fp.PartialResponse]:
@@ -220,81 +415,89 @@ class AstrologyBot(fp.PoeBot):
         """
         last_message = request.query[-1].content
 
-        # Try to parse structured birth data from Canvas
-        try:
-            data = json.loads(last_message)
-
-            if data.get("type") == "birth_data":
-                # Calculate natal chart
-                chart = calculate_chart(
-                    date=data["date"],
-                    time=data["time"],
-                    city=data["city"],
-                    house_system=data.get("house_system", "placidus"),
-                    zodiac_type=data.get("zodiac_type", "tropical"),
-                    sidereal_mode=data.get("sidereal_mode", "lahiri"),
-                )
-
-                # Get model selection (default to env var or Kimi-K2.5)
-                model = data.get("model", poe_model)
-                chart["meta"]["model"] = model
-
-                # Get optional initial context/question
-                initial_context = data.get("initial_context", "").strip()
-                if initial_context:
-                    chart["meta"]["initial_context"] = initial_context
-
-                # Check for transit date
-                transit_data = data.get("transit_date")
-                if transit_data:
-                    transits = calculate_transits(chart, transit_data)
-                    chart["transits"] = transits
-
-                # Send chart JSON for Canvas rendering (with delimiter)
-                chart_json = json.dumps(
-                    {
-                        "type": "chart_result",
-                        "chart": chart,
-                    }
-                )
-                yield fp.PartialResponse(text=chart_json + "\n---\n")
-
-                # Stream the interpretation
-                async for chunk in self.get_interpretation(
-                    chart, request, model, initial_context
-                ):
-                    yield chunk
-                return
-
-            elif data.get("type") == "follow_up":
-                # Handle follow-up questions with chart context
-                chart_data = data.get("chart_data")
-                question = data.get("question", "")
-                # Use the same model from the original chart calculation
-                model = chart_data.get("meta", {}).get("model") if chart_data else None
-                async for chunk in self.get_follow_up_response(
-                    chart_data, question, request, model
-                ):
-                    yield chunk
-                return
-
-        except (json.JSONDecodeError, KeyError, ValueError):
-            pass
+        # Try to parse structured birth data from Canvas. Plain-text input
+        # can't be a JSON object, so skip the decode attempt for it.
+        stripped = last_message.lstrip()
+        if stripped.startswith("{"):
+            try:
+                data = json.loads(stripped)
+
+                if data.get("type") == "birth_data":
+                    # Calculate natal chart
+                    chart = await calculate_chart_async(
+                        date=data["date"],
+                        time=data["time"],
+                        city=data["city"],
+                        house_system=data.get("house_system", "placidus"),
+                        zodiac_type=data.get("zodiac_type", "tropical"),
+                        sidereal_mode=data.get("sidereal_mode", "lahiri"),
+                        full_aspects=data.get("full_aspects", False),
+                    )
+
+                    # Get model selection (default to env var or Kimi-K2.5)
+                    model = data.get("model", poe_model)
+                    chart["meta"]["model"] = model
+
+                    # Get optional initial context/question
+                    initial_context = data.get("initial_context", "").strip()
+                    if initial_context:
+                        chart["meta"]["initial_context"] = initial_context
+
+                    # Check for transit date
+                    transit_data = data.get("transit_date")
+                    if transit_data:
+                        transits = await asyncio.to_thread(
+                            calculate_transits, chart, transit_data
+                        )
+                        chart["transits"] = transits
+
+                    # Send chart JSON for Canvas rendering (with delimiter)
+                    chart_json = orjson.dumps(
+                        {
+                            "type": "chart_result",
+                            "chart": chart,
+                        }
+                    ).decode()
+                    yield fp.PartialResponse(text=chart_json + "\n---\n")
+
+                    # Stream the interpretation
+                    async for chunk in self.get_interpretation(
+                        chart, request, model, initial_context
+                    ):
+                        yield chunk
+                    return
+
+                elif data.get("type") == "follow_up":
+                    # Handle follow-up questions with chart context
+                    chart_data = data.get("chart_data")
+                    question = data.get("question", "")
+                    # Use the same model from the original chart calculation
+                    model = (
+                        chart_data.get("meta", {}).get("model") if chart_data else None
+                    )
+                    async for chunk in self.get_follow_up_response(
+                        chart_data, question, request, model
+                    ):
+                        yield chunk
+                    return
+
+            except (json.JSONDecodeError, KeyError, ValueError):
+                pass
 
         birth_data = parse_plain_text_birth_data(last_message)
         if birth_data:
-            chart = calculate_chart(
+            chart = await calculate_chart_async(
                 date=birth_data["date"],
                 time=birth_data["time"],
                 city=birth_data["city"],
             )
 
-            chart_json = json.dumps(
+            chart_json = orjson.dumps(
                 {
                     "type": "chart_result",
                     "chart": chart,
                 }
-            )
+            ).decode()
             yield fp.PartialResponse(text=chart_json + "\n---\n")
 
             async for chunk in self.get_interpretation(chart, request):
@@ -350,10 +553,8 @@ class AstrologyBot(fp.PoeBot):
 
         # Stream from selected model
         try:
-            async for msg in fp.stream_request(
-                new_request,
-                selected_model,
-                request.access_key,
+            async for msg in _coalesce(
+                fp.stream_request(new_request, selected_model, request.access_key)
             ):
                 yield msg
         except Exception as e:
@@ -383,7 +584,7 @@ class AstrologyBot(fp.PoeBot):
         prompt = f"""You are an expert Western astrologer. The user has asked a follow-up question about their natal chart.
 
 Chart Data:
-{json.dumps(chart_data, indent=2)}
+{self.serialize_chart_context(chart_data, request.conversation_id)}
 
 User's Question: {question}
 
@@ -412,15 +613,52 @@ Keep them descriptive, specific to this chart, and build on the conversation so
         selected_model = model or poe_model
 
         try:
-            async for msg in fp.stream_request(
-                new_request,
-                selected_model,
-                request.access_key,
+            async for msg in _coalesce(
+                fp.stream_request(new_request, selected_model, request.access_key)
             ):
                 yield msg
         except Exception as e:
             yield fp.PartialResponse(text=f"\n\n*[Error: {str(e)}]*")
 
+    def serialize_chart_context(self, chart_data: dict, conversation_id: str) -> str:
+        """
+        Serialize chart data for the follow-up prompt, cached per conversation.
+
+        Aspects are trimmed to the 10 tightest orbs (as in the interpretation
+        prompt) and JSON is emitted without whitespace to keep the prompt short.
+
+        Args:
+            chart_data: The chart context sent by the Canvas app
+            conversation_id: Poe conversation the follow-up belongs to
+
+        Returns:
+            Compact JSON string of the chart context
+        """
+        if not chart_data:
+            return _dumps_compact(chart_data)
+
+        # A conversation can hold several charts, so key on the chart's meta too
+        transits_meta = (chart_data.get("transits") or {}).get("meta")
+        chart_id = _dumps_compact(
+            [chart_data.get("meta"), transits_meta], sort_keys=True
+        )
+        key = (conversation_id, chart_id)
+        serialized = self._chart_cache.get(key)
+        if serialized is not None:
+            self._chart_cache.move_to_end(key)
+            return serialized
+
+        trimmed = dict(chart_data)
+        if "aspects" in trimmed:
+            trimmed["aspects"] = sorted(trimmed["aspects"], key=_BY_ORB)[:10]
+
+        serialized = _dumps_compact(trimmed)
+        self._chart_cache[key] = serialized
+        if len(self._chart_cache) > _CHART_CACHE_SIZE:
+            self._chart_cache.popitem(last=False)
+
+        return serialized
+
     def build_interpretation_prompt(
         self, chart: dict, initial_context: str = None
     ) -> str:
@@ -434,30 +672,30 @@ Keep them descriptive, specific to this chart, and build on the conversation so
         Returns:
             Formatted prompt string
         """
-        # Format planets section
+        # Format placements section (angles first). Whole degrees are plenty
+        # for interpretation and keep the prompt short.
+        placements = {
+            "Ascendant": chart["ascendant"],
+            "Midheaven": chart["midheaven"],
+            **chart["planets"],
+        }
         planets_text = "\n".join(
-            [
-                f"  • {name}: {data['sign']} at {data['degree']}°"
-                for name, data in chart["planets"].items()
-            ]
+            f"• {name}: {sign} {int(degree)}°"
+            for name, (sign, degree) in _placement_fields(placements)
         )
 
         # Format houses section
         houses_text = "\n".join(
-            [
-                f"  • {house}: {data['sign']} at {data['degree']}°"
-                for house, data in chart["houses"].items()
-            ]
+            f"• {house}: {sign} {int(degree)}°"
+            for house, (sign, degree) in _placement_fields(chart["houses"])
         )
 
         # Format aspects section (top 10 by tightest orb)
         aspects = chart.get("aspects", [])
-        aspects_sorted = sorted(aspects, key=lambda x: x["orb"])[:10]
+        aspects_sorted = sorted(aspects, key=_BY_ORB)[:10]
         aspects_text = "\n".join(
-            [
-                f"  • {a['planet1']} {a['aspect']} {a['planet2']} (orb: {a['orb']}°)"
-                for a in aspects_sorted
-            ]
+            f"• {p1} {aspect} {p2} (orb {orb}°)"
+            for p1, aspect, p2, orb in map(_ASPECT_FIELDS, aspects_sorted)
         )
 
         # Check for transits
@@ -465,12 +703,10 @@ Keep them descriptive, specific to this chart, and build on the conversation so
         if "transits" in chart:
             transits = chart["transits"]
             transit_aspects = transits.get("transit_aspects", [])
-            transits_sorted = sorted(transit_aspects, key=lambda x: x["orb"])[:5]
+            transits_sorted = sorted(transit_aspects, key=_BY_ORB)[:5]
             transits_text = "\n\n**Current Transits:**\n" + "\n".join(
-                [
-                    f"  • {t['transit_planet']} {t['aspect']} your {t['natal_planet']} (orb: {t['orb']}°)"
-                    for t in transits_sorted
-                ]
+                f"• {p1} {aspect} natal {p2} (orb {orb}°)"
+                for p1, aspect, p2, orb in map(_TRANSIT_FIELDS, transits_sorted)
             )
 
         house_system = chart["meta"].get("house_system", "placidus")
@@ -489,52 +725,28 @@ Keep them descriptive, specific to this chart, and build on the conversation so
         # Add initial context section if provided
         context_instruction = ""
         if initial_context:
-            context_instruction = f"\n\n**User's Focus/Question:**\n{initial_context}\n\n**Important:** The user has provided specific context or a question above. Make sure your interpretation directly addresses their focus while still providing a complete chart reading."
+            context_instruction = f"\n**User's Focus/Question:** {initial_context}\nAddress this focus directly while still giving a complete reading.\n"
 
-        return f"""You are an expert Western astrologer with deep knowledge of natal chart interpretation. Provide a warm, nuanced, psychologically insightful reading.
+        return f"""You are an expert Western astrologer. Give a warm, nuanced, psychologically insightful natal chart reading.
 {context_instruction}
-**Birth Information:**
-• Date: {chart["meta"]["date"]}
-• Time: {chart["meta"]["time"]}
-• Location: {chart["meta"]["city"]}
-• Zodiac: {zodiac_info}
-• House System: {house_info}
-
-**Key Placements:**
-• Sun Sign: {chart["planets"]["Sun"]["sign"]}
-• Moon Sign: {chart["planets"]["Moon"]["sign"]}
-• Ascendant (Rising): {chart["ascendant"]["sign"]} at {chart["ascendant"]["degree"]}°
-• Midheaven: {chart["midheaven"]["sign"]} at {chart["midheaven"]["degree"]}°
-
-**All Planetary Positions:**
+**Birth:** {chart["meta"]["date"]} {chart["meta"]["time"]}, {chart["meta"]["city"]}
+**Zodiac:** {zodiac_info}
+**Houses:** {house_info}
+
+**Placements:**
 {planets_text}
 
 **House Cusps:**
 {houses_text}
 
-**Major Aspects (top 10):**
+**Aspects (tightest 10):**
 {aspects_text}{transits_text}
 
-**Instructions:**
-Provide a structured reading covering:
-1. **The Big Three** - Brief overview of Sun, Moon, and Rising combination
-2. **Sun Placement** - Core identity, vitality, life purpose
-3. **Moon Placement** - Emotional nature, needs, instincts
-4. **Ascendant** - Outer personality, first impressions, approach to life
-5. **Key Planetary Placements** - Mercury, Venus, Mars, and any notable placements
-6. **Major Aspects** - Interpret the most significant aspects (tightest orbs)
-7. **House Emphases** - Any notable house patterns
-
-Be specific to these exact placements. Avoid generic filler. Use warm, accessible language while maintaining astrological depth. Format with clear headers using **bold**.
+**Cover:** the Big Three (Sun, Moon, Rising) together; Sun (identity, purpose); Moon (emotions, needs); Ascendant (outer personality); Mercury, Venus, Mars and other notable placements; the tightest aspects; house emphases.
 
-At the very end, include a **Suggested questions:** section with 2-3 brief prompts for areas to explore. These appear as clickable buttons for the user.
+Be specific to these placements, no generic filler. Warm, accessible language with astrological depth. Use **bold** headers.
 
-Format each as a direct question like:
-- "Tell me about my Moon in the 4th house"
-- "What does the Saturn-Pluto square mean for my career?"
-- "How does my Venus-Mars conjunction affect relationships?"
-
-Keep them descriptive and specific to this chart. Avoid overly personal or prescriptive phrasing. One line each, numbered list (1. 2. 3.)."""
+End with a **Suggested questions:** section: 2-3 direct questions specific to this chart, shown to the user as clickable buttons, e.g. "What does the Saturn-Pluto square mean for my career?". Not overly personal or prescriptive. One line each, numbered list (1. 2. 3.)."""
 
 
 # Modal deployment configuration
@@ -543,6 +755,8 @@ REQUIREMENTS = [
     "pyswisseph>=2.10.0",
     "timezonefinder>=6.2.0",
     "geopy>=2.4.0",
+    "numpy>=1.26.0",
+    "orjson>=3.9.0",
 ]
 
 # Include ephemeris files in the image
@@ -569,9 +783,8 @@ if poe_model != "Kimi-K2.5":
 app = App("astrology-bot-poe")
 
 
-@app.function(image=image)
-@asgi_app()
-def fastapi_app():
+def make_poe_app():
+    """Build the Poe FastAPI app for the astrology bot."""
     bot = AstrologyBot()
     poe_app = fp.make_app(
         bot,
@@ -580,3 +793,17 @@ def fastapi_app():
         allow_without_key=not (bot_access_key and bot_name),
     )
     return poe_app
+
+
+# Keep one container warm and pre-load ephemeris data on container start so
+# the first request skips cold-start I/O
+@app.cls(image=image, scaledown_window=300, min_containers=1)
+class AstrologyBotApp:
+    @enter()
+    def load_ephemeris(self):
+        warm_up()
+
+    # Label keeps the endpoint URL the bot had as a plain function
+    @asgi_app(label="astrology-bot-poe-fastapi-app")
+    def fastapi_app(self):
+        return make_poe_app()
@@ -10,19 +10,48 @@ This module handles all astrological calculations including:
 
 """
 
+import asyncio
 from datetime import datetime
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 from typing import Dict, List, Tuple, Any
 
 import os
+import threading
+import numpy as np
 import swisseph as swe
+from geopy.adapters import URLLibAdapter
 from geopy.geocoders import Nominatim
 from timezonefinder import TimezoneFinder
 
 # Set ephemeris path if available
 _ephe_path = os.path.join(os.path.dirname(__file__), "ephe")
-if os.path.exists(_ephe_path):
-    swe.set_ephe_path(_ephe_path)
+
+# pyswisseph keeps Swiss Ephemeris state (ephemeris path, sidereal mode) per
+# thread, so each thread that calculates charts has to be initialized.
+_swe_thread = threading.local()
+
+
+def _init_swe_thread() -> None:
+    """Point Swiss Ephemeris at the bundled ephemeris files for this thread."""
+    if getattr(_swe_thread, "ready", False):
+        return
+    if os.path.exists(_ephe_path):
+        swe.set_ephe_path(_ephe_path)
+    _swe_thread.ready = True
+
+
+_init_swe_thread()
+
+# Geocoding clients are built once per process and reused across requests.
+# URLLibAdapter keeps geocoding synchronous.
+_GEOLOCATOR = Nominatim(user_agent="astro-poe-bot", adapter_factory=URLLibAdapter)
+
+# Load timezone polygons into memory for faster lookups where supported
+try:
+    _TF = TimezoneFinder(in_memory=True)
+except TypeError:
+    _TF = TimezoneFinder()
 
 
 # Planet mapping to Swiss Ephemeris IDs
@@ -41,6 +70,23 @@ PLANETS = {
     "Chiron": swe.CHIRON,
 }
 
+# Pre-resolved (name, id) pairs so calculate_planets doesn't re-walk the dict
+_PLANET_ITEMS: Tuple[Tuple[str, int], ...] = tuple(PLANETS.items())
+_PLANET_NAMES: List[str] = list(PLANETS)
+
+# Bodies slow enough that an hour of motion is below display precision
+_SLOW_PLANETS = frozenset(
+    {
+        swe.JUPITER,
+        swe.SATURN,
+        swe.URANUS,
+        swe.NEPTUNE,
+        swe.PLUTO,
+        swe.MEAN_NODE,
+        swe.CHIRON,
+    }
+)
+
 # Zodiac signs in order
 SIGNS = [
     "Aries",
@@ -66,6 +112,33 @@ ASPECT_DEFINITIONS = [
     ("opposition", 180, 8),
 ]
 
+# Aspect definitions as parallel arrays for the vectorized aspect kernel
+_ASPECT_NAMES = tuple(name for name, _, _ in ASPECT_DEFINITIONS)
+_ASPECT_ANGLES = np.array([angle for _, angle, _ in ASPECT_DEFINITIONS], dtype=float)
+_ASPECT_ORBS = np.array([orb for _, _, orb in ASPECT_DEFINITIONS], dtype=float)
+
+# Natal pairs skipped unless full aspects are requested: the slow outer planets
+# aspect each other for whole generations, and Node-Chiron is rarely read
+LOW_SIGNAL_PAIRS = [
+    ("Uranus", "Neptune"),
+    ("Uranus", "Pluto"),
+    ("Neptune", "Pluto"),
+    ("North Node", "Chiron"),
+]
+
+
+def _pair_mask(names: List[str]) -> np.ndarray:
+    """Boolean matrix over names that is False for LOW_SIGNAL_PAIRS."""
+    index = {name: i for i, name in enumerate(names)}
+    mask = np.ones((len(names), len(names)), dtype=bool)
+    for a, b in LOW_SIGNAL_PAIRS:
+        if a in index and b in index:
+            mask[index[a], index[b]] = mask[index[b], index[a]] = False
+    return mask
+
+
+_ASPECT_PAIR_MASK = _pair_mask(_PLANET_NAMES)
+
 # House system codes for Swiss Ephemeris
 HOUSE_SYSTEMS = {
     "placidus": b"P",
@@ -104,7 +177,7 @@ def longitude_to_sign(longitude: float) -> Dict[str, Any]:
     return {
         "sign": SIGNS[sign_index],
         "degree": round(degree, 2),
-        "longitude": round(longitude, 4),
+        "longitude": round(longitude, 2),
     }
 
 
@@ -112,6 +185,8 @@ def geocode_city(city: str) -> Tuple[float, float, str]:
     """
     Geocode a city name to coordinates and timezone.
 
+    Results are cached per city name, so repeat lookups skip the network.
+
     Args:
         city: City name (e.g., "Austin, TX" or "Paris, France")
 
@@ -121,27 +196,17 @@ def geocode_city(city: str) -> Tuple[float, float, str]:
     Raises:
         ValueError: If city cannot be geocoded
     """
-    import inspect
-    from geopy.adapters import URLLibAdapter
+    return _geocode_city_cached(city.strip())
 
-    # Use URLLibAdapter to ensure synchronous operation
-    geolocator = Nominatim(
-        user_agent="astro-poe-bot",
-        adapter_factory=URLLibAdapter,
-    )
-    location = geolocator.geocode(city)
-
-    # Handle potential coroutine
-    if inspect.isawaitable(location):
-        raise RuntimeError(
-            "Geocoding returned a coroutine. Expected synchronous result."
-        )
 
+@lru_cache(maxsize=4096)
+def _geocode_city_cached(city: str) -> Tuple[float, float, str]:
+    """Cached lookup behind geocode_city. Failed lookups raise and are not cached."""
+    location = _GEOLOCATOR.geocode(city)
     if not location:
         raise ValueError(f"Could not geocode city: {city}")
 
-    tf = TimezoneFinder()
-    timezone = tf.timezone_at(lat=location.latitude, lng=location.longitude)
+    timezone = _timezone_at(round(location.latitude, 2), round(location.longitude, 2))
 
     if not timezone:
         raise ValueError(f"Could not determine timezone for: {city}")
@@ -149,6 +214,12 @@ def geocode_city(city: str) -> Tuple[float, float, str]:
     return location.latitude, location.longitude, timezone
 
 
+@lru_cache(maxsize=16384)
+def _timezone_at(lat: float, lng: float) -> str | None:
+    """Timezone lookup cached on coordinates rounded to 0.01° (~1 km)."""
+    return _TF.timezone_at(lat=lat, lng=lng)
+
+
 def to_julian_day(dt: datetime) -> float:
     """
     Convert datetime to Julian Day.
@@ -167,31 +238,91 @@ def to_julian_day(dt: datetime) -> float:
     )
 
 
-def calculate_planets(
+def _calc_longitude(jd: float, planet_id: int, sidereal_mode: int | None) -> float:
+    """Compute a single ecliptic longitude with Swiss Ephemeris."""
+    _init_swe_thread()
+
+    flags = 0
+    if sidereal_mode is not None:
+        swe.set_sid_mode(sidereal_mode)
+        flags = swe.FLG_SIDEREAL
+
+    return swe.calc_ut(jd, planet_id, flags)[0][0]
+
+
+@lru_cache(maxsize=65536)
+def _minute_longitude(
+    jd_minute: int, planet_id: int, sidereal_mode: int | None
+) -> float:
+    """Longitude cached in 1-minute JD bins (fast-moving bodies)."""
+    return _calc_longitude(jd_minute / 1440.0, planet_id, sidereal_mode)
+
+
+@lru_cache(maxsize=16384)
+def _hour_longitude(jd_hour: int, planet_id: int, sidereal_mode: int | None) -> float:
+    """Longitude cached in 1-hour JD bins (slow-moving bodies)."""
+    return _calc_longitude(jd_hour / 24.0, planet_id, sidereal_mode)
+
+
+def _longitude(jd: float, planet_id: int, sidereal_mode: int | None = None) -> float:
+    """
+    Get a planet's longitude, served from a rounded-JD cache.
+
+    Fast bodies (Sun through Mars) are binned to the minute; the Moon moves
+    under 0.01° in that time. Slow bodies are binned to the hour.
+
+    Args:
+        jd: Julian Day
+        planet_id: Swiss Ephemeris planet ID
+        sidereal_mode: Optional sidereal mode constant from swe
+
+    Returns:
+        Longitude in degrees (0-360)
+    """
+    if planet_id in _SLOW_PLANETS:
+        return _hour_longitude(round(jd * 24), planet_id, sidereal_mode)
+    return _minute_longitude(round(jd * 1440), planet_id, sidereal_mode)
+
+
+def _calculate_positions(
     jd: float, sidereal_mode: int | None = None
-) -> Dict[str, Dict[str, Any]]:
+) -> Tuple[Dict[str, Dict[str, Any]], np.ndarray]:
     """
-    Calculate positions of all planets.
+    Calculate positions of all planets, plus their raw longitudes.
 
     Args:
         jd: Julian Day
         sidereal_mode: Optional sidereal mode constant from swe
 
     Returns:
-        Dict mapping planet names to their positions
+        Tuple of (planets_dict, longitudes). longitudes holds the unrounded
+        values in _PLANET_NAMES order, for aspect math.
     """
     planets = {}
+    lons = np.empty(len(_PLANET_ITEMS))
 
-    flags = 0
-    if sidereal_mode is not None:
-        swe.set_sid_mode(sidereal_mode)
-        flags = swe.FLG_SIDEREAL
+    for i, (name, planet_id) in enumerate(_PLANET_ITEMS):
+        lon = _longitude(jd, planet_id, sidereal_mode)
+        lons[i] = lon
+        planets[name] = longitude_to_sign(lon)
 
-    for name, planet_id in PLANETS.items():
-        result, _ = swe.calc_ut(jd, planet_id, flags)
-        planets[name] = longitude_to_sign(result[0])
+    return planets, lons
 
-    return planets
+
+def calculate_planets(
+    jd: float, sidereal_mode: int | None = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Calculate positions of all planets.
+
+    Args:
+        jd: Julian Day
+        sidereal_mode: Optional sidereal mode constant from swe
+
+    Returns:
+        Dict mapping planet names to their positions
+    """
+    return _calculate_positions(jd, sidereal_mode)[0]
 
 
 def calculate_houses(
@@ -214,6 +345,8 @@ def calculate_houses(
     Returns:
         Tuple of (houses_dict, ascendant, midheaven)
     """
+    _init_swe_thread()
+
     flags = 0
     if sidereal_mode is not None:
         swe.set_sid_mode(sidereal_mode)
@@ -231,66 +364,108 @@ def calculate_houses(
     return house_cusps, ascendant, midheaven
 
 
-def calculate_aspects(planets: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+def _longitudes(planets: Dict[str, Dict[str, Any]]) -> np.ndarray:
+    """Pull planet longitudes into an array, in the dict's order."""
+    return np.fromiter(
+        (data["longitude"] for data in planets.values()),
+        dtype=float,
+        count=len(planets),
+    )
+
+
+def _aspects_between(
+    names_a: List[str],
+    lons_a: np.ndarray,
+    names_b: List[str],
+    lons_b: np.ndarray,
+    keys: Tuple[str, str] = ("planet1", "planet2"),
+    upper_triangle: bool = False,
+    pair_mask: np.ndarray | None = None,
+) -> List[Dict[str, Any]]:
+    """
+    Find aspects between every body in one set and every body in another.
+
+    Args:
+        names_a: Names of the first set of bodies
+        lons_a: Longitudes of the first set, aligned with names_a
+        names_b: Names of the second set of bodies
+        lons_b: Longitudes of the second set, aligned with names_b
+        keys: Result keys for the first and second body names
+        upper_triangle: Only keep pairs with i < j (for a set against itself)
+        pair_mask: Optional boolean matrix of pairs to consider
+
+    Returns:
+        List of aspect dictionaries, ordered by (a, b, aspect)
+    """
+    # Pairwise angular separation, folded into 0-180
+    diff = np.abs(lons_a[:, None] - lons_b[None, :])
+    diff = np.minimum(diff, 360 - diff)
+
+    # Distance of every pair from every aspect angle
+    delta = np.abs(diff[..., None] - _ASPECT_ANGLES)
+    hits = delta <= _ASPECT_ORBS
+    if upper_triangle:
+        hits &= np.triu(np.ones(diff.shape, dtype=bool), k=1)[..., None]
+    if pair_mask is not None:
+        hits &= pair_mask[..., None]
+
+    key_a, key_b = keys
+    return [
+        {
+            key_a: names_a[i],
+            key_b: names_b[j],
+            "aspect": _ASPECT_NAMES[k],
+            "angle": ASPECT_DEFINITIONS[k][1],
+            "orb": round(orb, 2),
+        }
+        for i, j, k, orb in zip(*np.nonzero(hits), delta[hits].tolist())
+    ]
+
+
+def calculate_aspects(
+    planets: Dict[str, Dict[str, Any]],
+    lons: np.ndarray | None = None,
+    full_aspects: bool = False,
+) -> List[Dict[str, Any]]:
     """
     Calculate aspects between planets.
 
     Args:
         planets: Dict of planet positions
+        lons: Optional longitudes aligned with planets; read from the dict
+            when omitted
+        full_aspects: Include LOW_SIGNAL_PAIRS (skipped by default)
 
     Returns:
         List of aspect dictionaries
     """
-    aspects = []
-    planet_names = list(planets.keys())
-
-    for i, p1 in enumerate(planet_names):
-        for p2 in planet_names[i + 1 :]:
-            lon1 = planets[p1]["longitude"]
-            lon2 = planets[p2]["longitude"]
-
-            # Calculate angular difference
-            diff = abs(lon1 - lon2)
-            if diff > 180:
-                diff = 360 - diff
-
-            # Check for aspects
-            for aspect_name, angle, orb in ASPECT_DEFINITIONS:
-                if abs(diff - angle) <= orb:
-                    aspects.append(
-                        {
-                            "planet1": p1,
-                            "planet2": p2,
-                            "aspect": aspect_name,
-                            "angle": angle,
-                            "orb": round(abs(diff - angle), 2),
-                        }
-                    )
-
-    return aspects
+    names = list(planets)
+    if lons is None:
+        lons = _longitudes(planets)
 
+    pair_mask = None
+    if not full_aspects:
+        pair_mask = _ASPECT_PAIR_MASK if names == _PLANET_NAMES else _pair_mask(names)
 
-def calculate_chart(
+    return _aspects_between(
+        names, lons, names, lons, upper_triangle=True, pair_mask=pair_mask
+    )
+
+
+def _resolve_chart_inputs(
     date: str,
     time: str,
     city: str,
-    house_system: str = "placidus",
-    zodiac_type: str = "tropical",
-    sidereal_mode: str = "lahiri",
-) -> Dict[str, Any]:
+    house_system: str,
+    zodiac_type: str,
+    sidereal_mode: str,
+) -> Tuple[float, float, float, int | None, bytes, Dict[str, Any]]:
     """
-    Calculate a complete natal chart.
-
-    Args:
-        date: Date string in format "YYYY-MM-DD"
-        time: Time string in format "HH:MM" (24-hour)
-        city: City name for geocoding
-        house_system: House system name (placidus, koch, whole_sign, equal, etc.)
-        zodiac_type: "tropical" or "sidereal"
-        sidereal_mode: Sidereal ayanamsa mode (lahiri, fagan_bradley, raman, etc.)
+    Geocode the birth city and resolve everything the calculations need.
 
     Returns:
-        Complete chart data including planets, houses, aspects, and metadata
+        Tuple of (julian_day, latitude, longitude, sidereal_mode_constant,
+        house_system_code, chart_meta)
 
     Raises:
         ValueError: If date/time format is invalid or city cannot be geocoded
@@ -317,12 +492,33 @@ def calculate_chart(
     # Get house system code
     house_sys_code = HOUSE_SYSTEMS.get(house_system, b"P")
 
-    # Calculate chart components
-    planets = calculate_planets(jd, sid_mode)
-    houses, ascendant, midheaven = calculate_houses(
-        jd, lat, lon, house_sys_code, sid_mode
-    )
-    aspects = calculate_aspects(planets)
+    meta = {
+        "date": date,
+        "time": time,
+        "city": city,
+        "latitude": round(lat, 2),
+        "longitude": round(lon, 2),
+        "timezone": tz_name,
+        "utc_datetime": utc_dt.isoformat(),
+        "julian_day": jd,
+        "house_system": house_system,
+        "zodiac_type": zodiac_type,
+        "sidereal_mode": sidereal_mode if zodiac_type == "sidereal" else None,
+    }
+
+    return jd, lat, lon, sid_mode, house_sys_code, meta
+
+
+def _assemble_chart(
+    positions: Tuple[Dict[str, Dict[str, Any]], np.ndarray],
+    house_cusps: Tuple[Dict[str, Dict[str, Any]], Dict[str, Any], Dict[str, Any]],
+    meta: Dict[str, Any],
+    full_aspects: bool,
+) -> Dict[str, Any]:
+    """Combine planet and house results into the chart dict."""
+    planets, planet_lons = positions
+    houses, ascendant, midheaven = house_cusps
+    aspects = calculate_aspects(planets, planet_lons, full_aspects)
 
     return {
         "planets": planets,
@@ -330,22 +526,90 @@ def calculate_chart(
         "ascendant": ascendant,
         "midheaven": midheaven,
         "aspects": aspects,
-        "meta": {
-            "date": date,
-            "time": time,
-            "city": city,
-            "latitude": round(lat, 4),
-            "longitude": round(lon, 4),
-            "timezone": tz_name,
-            "utc_datetime": utc_dt.isoformat(),
-            "julian_day": jd,
-            "house_system": house_system,
-            "zodiac_type": zodiac_type,
-            "sidereal_mode": sidereal_mode if zodiac_type == "sidereal" else None,
-        },
+        "meta": meta,
     }
 
 
+def calculate_chart(
+    date: str,
+    time: str,
+    city: str,
+    house_system: str = "placidus",
+    zodiac_type: str = "tropical",
+    sidereal_mode: str = "lahiri",
+    full_aspects: bool = False,
+) -> Dict[str, Any]:
+    """
+    Calculate a complete natal chart.
+
+    Args:
+        date: Date string in format "YYYY-MM-DD"
+        time: Time string in format "HH:MM" (24-hour)
+        city: City name for geocoding
+        house_system: House system name (placidus, koch, whole_sign, equal, etc.)
+        zodiac_type: "tropical" or "sidereal"
+        sidereal_mode: Sidereal ayanamsa mode (lahiri, fagan_bradley, raman, etc.)
+        full_aspects: Include low-signal planet pairs in the aspect list
+
+    Returns:
+        Complete chart data including planets, houses, aspects, and metadata
+
+    Raises:
+        ValueError: If date/time format is invalid or city cannot be geocoded
+    """
+    jd, lat, lon, sid_mode, house_sys_code, meta = _resolve_chart_inputs(
+        date, time, city, house_system, zodiac_type, sidereal_mode
+    )
+
+    # Calculate chart components
+    positions = _calculate_positions(jd, sid_mode)
+    house_cusps = calculate_houses(jd, lat, lon, house_sys_code, sid_mode)
+
+    return _assemble_chart(positions, house_cusps, meta, full_aspects)
+
+
+async def calculate_chart_async(
+    date: str,
+    time: str,
+    city: str,
+    house_system: str = "placidus",
+    zodiac_type: str = "tropical",
+    sidereal_mode: str = "lahiri",
+    full_aspects: bool = False,
+) -> Dict[str, Any]:
+    """
+    Async variant of calculate_chart that keeps the event loop free.
+
+    Geocoding runs in a worker thread; once the Julian Day is known, planet
+    and house calculations run concurrently in separate threads.
+
+    Args:
+        Same as calculate_chart
+
+    Returns:
+        Complete chart data including planets, houses, aspects, and metadata
+
+    Raises:
+        ValueError: If date/time format is invalid or city cannot be geocoded
+    """
+    jd, lat, lon, sid_mode, house_sys_code, meta = await asyncio.to_thread(
+        _resolve_chart_inputs,
+        date,
+        time,
+        city,
+        house_system,
+        zodiac_type,
+        sidereal_mode,
+    )
+
+    positions, house_cusps = await asyncio.gather(
+        asyncio.to_thread(_calculate_positions, jd, sid_mode),
+        asyncio.to_thread(calculate_houses, jd, lat, lon, house_sys_code, sid_mode),
+    )
+
+    return _assemble_chart(positions, house_cusps, meta, full_aspects)
+
+
 def calculate_transits(
     natal_chart: Dict[str, Any], transit_date: str, transit_time: str = "12:00"
 ) -> Dict[str, Any]:
@@ -373,31 +637,17 @@ def calculate_transits(
     jd = to_julian_day(utc_dt)
 
     # Calculate transit planet positions
-    transit_planets = calculate_planets(jd)
+    transit_planets, transit_lons = _calculate_positions(jd)
 
     # Calculate transits to natal planets
-    transit_aspects = []
-    for transit_name, transit_data in transit_planets.items():
-        for natal_name, natal_data in natal_chart["planets"].items():
-            lon1 = transit_data["longitude"]
-            lon2 = natal_data["longitude"]
-
-            diff = abs(lon1 - lon2)
-            if diff > 180:
-                diff = 360 - diff
-
-            # Check for aspects (slightly wider orbs for transits)
-            for aspect_name, angle, orb in ASPECT_DEFINITIONS:
-                if abs(diff - angle) <= orb:
-                    transit_aspects.append(
-                        {
-                            "transit_planet": transit_name,
-                            "natal_planet": natal_name,
-                            "aspect": aspect_name,
-                            "angle": angle,
-                            "orb": round(abs(diff - angle), 2),
-                        }
-                    )
+    natal_planets = natal_chart["planets"]
+    transit_aspects = _aspects_between(
+        _PLANET_NAMES,
+        transit_lons,
+        list(natal_planets),
+        _longitudes(natal_planets),
+        keys=("transit_planet", "natal_planet"),
+    )
 
     return {
         "transit_planets": transit_planets,
@@ -411,6 +661,27 @@ def calculate_transits(
     }
 
 
+def warm_up() -> None:
+    """
+    Pre-load ephemeris data and run a throwaway chart so the first real
+    request doesn't pay for file I/O and first-call initialization.
+
+    Geocoding is skipped since it needs the network; the TimezoneFinder
+    data is already loaded at import.
+    """
+    _init_swe_thread()
+
+    # Page in the planetary and lunar ephemeris files (J2000.0)
+    jd = 2451545.0
+    for planet_id in range(swe.SUN, swe.PLUTO + 1):
+        swe.calc_ut(jd, planet_id, 0)
+
+    planets = calculate_planets(jd)
+    calculate_houses(jd, 0.0, 0.0)
+    calculate_aspects(planets)
+    _timezone_at(0.0, 0.0)
+
+
 # Test function for local development
 if __name__ == "__main__":
     # Test with a sample chart
@@ -0,0 +1,40 @@
+"""Tests for follow-up chart context serialization in astrology_bot."""
+
+import json
+
+from astrology_bot import AstrologyBot
+
+CHART = {
+    "planets": {"Sun": {"sign": "Pisces", "degree": 24.99, "longitude": 354.99}},
+    "aspects": [
+        {"planet1": "Sun", "planet2": "Moon", "aspect": "trine", "orb": orb}
+        for orb in (5.0, 0.5, 3.0, 1.0, 7.0, 2.0, 6.0, 4.0, 0.1, 2.5, 1.5, 3.5)
+    ],
+    "meta": {"date": "1990-03-15", "time": "14:30", "city": "Austin, TX"},
+}
+
+
+def test_serialize_chart_context_is_compact_and_trimmed():
+    serialized = AstrologyBot().serialize_chart_context(CHART, "conv")
+
+    assert " " not in serialized.replace("Austin, TX", "")
+    orbs = [a["orb"] for a in json.loads(serialized)["aspects"]]
+    assert orbs == sorted(a["orb"] for a in CHART["aspects"])[:10]
+
+
+def test_serialize_chart_context_is_cached_per_chart():
+    bot = AstrologyBot()
+    first = bot.serialize_chart_context(CHART, "conv")
+
+    assert bot.serialize_chart_context(CHART, "conv") is first
+
+    other = {**CHART, "meta": {**CHART["meta"], "time": "15:30"}}
+    assert bot.serialize_chart_context(other, "conv") is not first
+
+
+def test_serialize_chart_context_handles_big_integers():
+    chart = {**CHART, "meta": {**CHART["meta"], "id": 2**70}}
+
+    serialized = AstrologyBot().serialize_chart_context(chart, "conv")
+
+    assert json.loads(serialized)["meta"]["id"] == 2**70
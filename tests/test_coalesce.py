@@ -0,0 +1,74 @@
+"""Tests for streamed-chunk coalescing in astrology_bot."""
+
+import asyncio
+
+import fastapi_poe as fp
+
+from astrology_bot import _coalesce
+
+
+async def _collect(source):
+    return [msg async for msg in _coalesce(source)]
+
+
+def test_first_text_passes_through_after_meta():
+    # The source only continues once the consumer has seen "First". With a
+    # flush delay far longer than the test timeout, a buffered first token
+    # would deadlock instead of passing through.
+    first_seen = asyncio.Event()
+
+    async def source():
+        yield fp.MetaResponse(text="", content_type="text/markdown")
+        yield fp.PartialResponse(text="First")
+        await first_seen.wait()
+        yield fp.PartialResponse(text=" second")
+
+    async def consume():
+        out = []
+        async for msg in _coalesce(source(), max_delay=60):
+            out.append(msg)
+            if msg.text == "First":
+                first_seen.set()
+        return out
+
+    out = asyncio.run(asyncio.wait_for(consume(), timeout=5))
+
+    assert isinstance(out[0], fp.MetaResponse)
+    assert out[1].text == "First"
+    assert "".join(msg.text for msg in out) == "First second"
+
+
+def test_text_chunks_are_merged():
+    async def source():
+        for i in range(5):
+            yield fp.PartialResponse(text=str(i))
+
+    out = [msg.text for msg in asyncio.run(_collect(source()))]
+
+    assert out == ["0", "1234"]
+
+
+def test_chunks_with_different_index_are_not_merged():
+    async def source():
+        yield fp.PartialResponse(text="a", index=0)
+        yield fp.PartialResponse(text="b", index=0)
+        yield fp.PartialResponse(text="c", index=0)
+        yield fp.PartialResponse(text="d", index=1)
+        yield fp.PartialResponse(text="e", index=1)
+
+    out = [(msg.text, msg.index) for msg in asyncio.run(_collect(source()))]
+
+    assert out == [("a", 0), ("bc", 0), ("de", 1)]
+
+
+def test_non_text_messages_flush_and_pass_through():
+    async def source():
+        yield fp.PartialResponse(text="a")
+        yield fp.PartialResponse(text="b")
+        yield fp.PartialResponse(text="Ask more", is_suggested_reply=True)
+        yield fp.PartialResponse(text="c")
+
+    out = asyncio.run(_collect(source()))
+
+    assert [m.text for m in out] == ["a", "b", "Ask more", "c"]
+    assert out[2].is_suggested_reply
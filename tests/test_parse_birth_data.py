@@ -0,0 +1,75 @@
+"""Tests for plain-text birth data parsing in astrology_bot."""
+
+import pytest
+
+from astrology_bot import normalize_time, parse_plain_text_birth_data
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        (
+            "1992-10-28, 22:30, Lexington, KY",
+            {"date": "1992-10-28", "time": "22:30", "city": "Lexington, KY"},
+        ),
+        (
+            "October 28, 1992, 10:30 PM, Paris, France",
+            {"date": "1992-10-28", "time": "22:30", "city": "Paris, France"},
+        ),
+        (
+            "10/28/1992 10:30 pm New York, NY",
+            {"date": "1992-10-28", "time": "22:30", "city": "New York, NY"},
+        ),
+        (
+            "1992-10-28 22:30:15 Paris, France",
+            {"date": "1992-10-28", "time": "22:30", "city": "Paris, France"},
+        ),
+        (
+            "1992-10-28, 22:30, Paris, France.",
+            {"date": "1992-10-28", "time": "22:30", "city": "Paris, France"},
+        ),
+        (
+            "Paris, France, October 28, 1992, 10:30 PM",
+            {"date": "1992-10-28", "time": "22:30", "city": "Paris, France"},
+        ),
+    ],
+)
+def test_parse_plain_text_birth_data(text, expected):
+    assert parse_plain_text_birth_data(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "hello",
+        "1992-10-28 22:30",
+        "1992-10-28 Paris",
+        "1992-10-28 22:30 PM Paris, France",
+        "1992-10-28 13 PM Paris, France",
+        "1992-10-28 24:30 Paris, France",
+    ],
+)
+def test_parse_plain_text_birth_data_rejects_incomplete_input(text):
+    assert parse_plain_text_birth_data(text) is None
+
+
+@pytest.mark.parametrize(
+    ("time_str", "expected"),
+    [
+        ("10:30 PM", "22:30"),
+        ("12:05 am", "00:05"),
+        ("12 PM", "12:00"),
+        ("7 AM", "07:00"),
+        ("23:59", "23:59"),
+        ("0:00", "00:00"),
+    ],
+)
+def test_normalize_time(time_str, expected):
+    assert normalize_time(time_str) == expected
+
+
+@pytest.mark.parametrize(
+    "time_str", ["22:30 PM", "0:30 AM", "13 PM", "0 AM", "24:00", "12:60", "25"]
+)
+def test_normalize_time_rejects_invalid_times(time_str):
+    assert normalize_time(time_str) is None